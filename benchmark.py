@@ -0,0 +1,187 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+import duck
+from mock_pomelo import MockPomeloServer, add_settings_arguments, parse_settings
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.samples[stage].append(seconds)
+
+    def percentiles(self, stage: str) -> Dict[str, float]:
+        samples = sorted(self.samples[stage])
+        if not samples:
+            return {}
+
+        def pick(fraction: float) -> float:
+            return samples[min(int(fraction * len(samples)), len(samples) - 1)] * 1000
+
+        return {
+            "count": len(samples),
+            "p50_ms": pick(0.50),
+            "p90_ms": pick(0.90),
+            "p99_ms": pick(0.99),
+            "max_ms": samples[-1] * 1000
+        }
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        return {stage: self.percentiles(stage) for stage in self.samples}
+
+class TimedDiscordAPI(duck.DiscordAPI):
+    def __init__(self, config: duck.Configuration, recorder: LatencyRecorder):
+        super().__init__(config)
+        self.recorder = recorder
+
+    async def check(self, username: str) -> duck.CheckResult:
+        result = await super().check(username)
+        self.recorder.add("api", result.latency)
+        return result
+
+class TimedValidator(duck.UsernameValidator):
+    def __init__(self, recorder: LatencyRecorder):
+        super().__init__()
+        self.recorder = recorder
+
+    def normalize(self, username: str):
+        started = time.perf_counter()
+        result = super().normalize(username)
+        self.recorder.add("validate", time.perf_counter() - started)
+        return result
+
+class TimedPipeline(duck.CheckPipeline):
+    def __init__(self, recorder: LatencyRecorder, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+        self.sinks = {stage: self._timed(stage, sink) for stage, sink in self.sinks.items()}
+
+    def _timed(self, stage: str, sink):
+        async def timed_sink(result: duck.CheckResult) -> None:
+            started = time.perf_counter()
+            await sink(result)
+            self.recorder.add(stage, time.perf_counter() - started)
+
+        return timed_sink
+
+def timed_names(generator: duck.UsernameGenerator, length: int, count: int, recorder: LatencyRecorder):
+    names = generator.enumerate_keyspace(length, "permutation", seed=0)
+
+    for _ in range(count):
+        started = time.perf_counter()
+        name = next(names, None)
+        recorder.add("generate", time.perf_counter() - started)
+
+        if name is None:
+            return
+        yield name
+
+def peak_memory_mb() -> float:
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+async def run_benchmark(args: argparse.Namespace) -> Dict:
+    server = MockPomeloServer(parse_settings(args))
+    url = await server.start()
+    recorder = LatencyRecorder()
+
+    with tempfile.TemporaryDirectory() as directory:
+        workdir = Path(directory)
+        config = duck.Configuration(
+            discord_token="benchmark-token",
+            request_delay=args.request_delay,
+            cache_file=str(workdir / "cache.db"),
+            api_base_url=url
+        )
+
+        generator = duck.UsernameGenerator(config)
+        validator = TimedValidator(recorder)
+        result_manager = duck.ResultManager(workdir / "available.txt", workdir / "results.jsonl",
+                                            dead_letter_file=workdir / "dead_letter.txt")
+        webhook_notifier = duck.WebhookNotifier("")
+
+        if args.tracemalloc:
+            tracemalloc.start()
+
+        started = time.perf_counter()
+        await result_manager.start()
+
+        try:
+            with duck.ResultCache(config) as cache, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                async with TimedDiscordAPI(config, recorder) as api:
+                    pipeline = TimedPipeline(recorder, api, cache, validator, result_manager, webhook_notifier,
+                                             None, config.pipeline_queue_size,
+                                             renderer=duck.ConsoleRenderer(args.console, metrics=api.metrics))
+                    usernames = timed_names(generator, args.length, args.count, recorder)
+                    await pipeline.run(duck.UsernameChecker._iterate(usernames))
+        finally:
+            await result_manager.close()
+            await server.stop()
+
+        elapsed = time.perf_counter() - started
+        peak_memory = peak_memory_mb()
+
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+    stats = result_manager.get_stats()
+    return {
+        "checks": stats["total_checked"],
+        "available": stats["total_available"],
+        "elapsed_s": elapsed,
+        "checks_per_second": stats["total_checked"] / elapsed if elapsed else 0.0,
+        "peak_memory_mb": peak_memory,
+        "peak_memory_source": "tracemalloc" if args.tracemalloc else "ru_maxrss",
+        "server": server.stats,
+        "stages": recorder.report()
+    }
+
+def print_report(report: Dict) -> None:
+    print(f"Checks:          {report['checks']} ({report['available']} available)")
+    print(f"Elapsed:         {report['elapsed_s']:.3f}s")
+    print(f"Throughput:      {report['checks_per_second']:.1f} checks/s")
+    print(f"Peak memory:     {report['peak_memory_mb']:.1f} MB ({report['peak_memory_source']})")
+    print(f"Server:          {report['server']}")
+    print()
+    print(f"{'stage':<10} {'count':>8} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+
+    for stage, values in report["stages"].items():
+        print(f"{stage:<10} {values['count']:>8} {values['p50_ms']:>10.3f} {values['p90_ms']:>10.3f} "
+              f"{values['p99_ms']:>10.3f} {values['max_ms']:>10.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark duck.py against a local mock pomelo server")
+    parser.add_argument("--count", type=int, default=2000, help="number of usernames to check")
+    parser.add_argument("--length", type=int, default=4, help="username length for generated names")
+    parser.add_argument("--request-delay", type=float, default=0.0, help="minimum delay between requests")
+    parser.add_argument("--console", choices=("full", "quiet"), default="full", help="console renderer mode to measure")
+    parser.add_argument("--tracemalloc", action="store_true", help="measure peak memory with tracemalloc")
+    parser.add_argument("--json", dest="json_output", help="also write the report to this JSON file")
+    add_settings_arguments(parser)
+    arguments = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(arguments))
+    print_report(result)
+
+    if arguments.json_output:
+        with open(arguments.json_output, "w") as file:
+            json.dump(result, file, indent=2)
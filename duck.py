@@ -1,19 +1,53 @@
+from __future__ import annotations
+
+import argparse
 import asyncio
+import collections
+import cProfile
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
 import json
 import logging
+import math
+import mmap
+import os
 import random
+import re
+import sqlite3
 import string
 import sys
+import time
+import tracemalloc
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Iterable, Iterator, AsyncIterator, Sequence
 from datetime import datetime
-import aiohttp
-import aiofiles
 from colorama import init, Fore, Style, Back
-init(autoreset=True)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson:
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps_bytes(data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
 
 class Display:
+    live_renderer = None
+
     @staticmethod
     def print_banner():
         banner = f"""
@@ -77,6 +111,8 @@ class Display:
             "checking": f"{Fore.BLUE}[?]"
         }
         icon = icons.get(status_type, icons["info"])
+        if Display.live_renderer:
+            Display.live_renderer.clear()
         print(f"{icon} {Fore.WHITE}{message}{Style.RESET_ALL}")
 
     @staticmethod
@@ -92,10 +128,26 @@ class Display:
         print(f"║                                                      ║")
         print(f"║  {Fore.WHITE}Available Usernames Found: {Fore.GREEN}{stats['total_available']:<15}{Fore.CYAN} ║")
         print(f"║  {Fore.WHITE}Total Checked: {Fore.YELLOW}{stats.get('total_checked', 0):<26}{Fore.CYAN} ║")
+        print(f"║  {Fore.WHITE}Requests Saved: {Fore.YELLOW}{stats.get('requests_saved', 0):<25}{Fore.CYAN} ║")
+        print(f"║    {Fore.LIGHTBLACK_EX}Cache Hits: {stats.get('cache_hits', 0):<27}{Fore.CYAN} ║")
+        print(f"║    {Fore.LIGHTBLACK_EX}Invalid: {stats.get('rejected_invalid', 0):<8} Duplicates: {stats.get('rejected_duplicate', 0):<9}{Fore.CYAN} ║")
         print(f"║  {Fore.WHITE}Output File: {Fore.MAGENTA}{stats['output_file']:<28}{Fore.CYAN} ║")
         print(f"║                                                      ║")
         print(f"╚══════════════════════════════════════════════════════╝{Style.RESET_ALL}")
 
+    @staticmethod
+    def print_coverage_report(report: Dict):
+        covered = report['taken'] + report['available'] + report.get('invalid', 0)
+        percent = covered / report['keyspace'] * 100 if report['keyspace'] else 0.0
+        print(f"\n{Fore.CYAN}┌─────────────────── Keyspace Coverage ───────────────────┐")
+        print(f"│ {Fore.WHITE}Keyspace:{Fore.YELLOW} {report['keyspace']:<20,} {Fore.WHITE}Covered:{Fore.YELLOW} {percent:>6.2f}%{Fore.CYAN} │")
+        print(f"│ {Fore.GREEN}Available: {report['available']:<12,}{Fore.RED}Taken: {report['taken']:<16,}{Fore.CYAN} │")
+        print(f"│ {Fore.YELLOW}Errors: {report['error']:<15,}{Fore.LIGHTBLACK_EX}Unchecked: {report['unchecked']:<13,}{Fore.CYAN} │")
+        if report.get('invalid'):
+            print(f"│ {Fore.LIGHTBLACK_EX}Invalid: {report['invalid']:<37,}{Fore.CYAN} │")
+        print(f"│ {Fore.WHITE}File:{Fore.MAGENTA} {report['coverage_file']:<49}{Fore.CYAN} │")
+        print(f"└──────────────────────────────────────────────────────────┘{Style.RESET_ALL}")
+
 @dataclass
 class Configuration:
     discord_token: str = ""
@@ -105,6 +157,32 @@ class Configuration:
     enable_symbols: bool = False
     webhook_url: str = ""
     multi_token_mode: bool = False
+    cache_file: str = "results_cache.db"
+    cache_ttl_taken: float = 7 * 24 * 3600
+    cache_ttl_available: float = 3600
+    cache_ttl_error: float = 300
+    max_retries: int = 5
+    results_file: str = "results.jsonl"
+    results_format: str = "jsonl"
+    write_batch_size: int = 100
+    write_flush_interval: float = 1.0
+    pipeline_queue_size: int = 256
+    api_base_url: str = "https://discord.com/api/v9"
+    request_timeout: float = 30.0
+    max_check_retries: int = 3
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    retry_queue_size: int = 1000
+    dead_letter_file: str = "dead_letter.txt"
+    console_mode: str = "auto"
+    console_refresh_rate: float = 4.0
+    dedup_capacity: int = 5000000
+    dedup_error_rate: float = 0.001
+    metrics_file: str = "metrics.json"
+    metrics_interval: float = 5.0
+    metrics_port: int = 0
+    profile_mode: str = ""
+    profile_file: str = "duck_profile"
 
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -124,7 +202,16 @@ class ConfigManager:
 
         return self.config
 
+    def load_without_prompt(self) -> Configuration:
+        if self.config_path.exists():
+            with open(self.config_path, 'r') as file:
+                self.config = Configuration(**json.load(file))
+
+        return self.config
+
     async def _load_existing_config(self) -> None:
+        import aiofiles
+
         try:
             async with aiofiles.open(self.config_path, 'r') as file:
                 data = json.loads(await file.read())
@@ -179,20 +266,217 @@ class ConfigManager:
             Display.print_status("Please enter y/n", "warning")
 
     async def _save_config(self) -> None:
+        import aiofiles
+
         async with aiofiles.open(self.config_path, 'w') as file:
             await file.write(json.dumps(self.config.to_dict(), indent=2))
         Display.print_status("Configuration saved", "success")
 
+class Metrics:
+    LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    RATE_WINDOW = 10.0
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.status_counts: Dict[str, int] = collections.Counter()
+        self.latency_buckets = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.rate_limited = 0
+        self.rate_limit_wait = 0.0
+        self.errors: Dict[str, int] = collections.Counter()
+        self.stage_seconds: Dict[str, float] = collections.defaultdict(float)
+        self.stage_calls: Dict[str, int] = collections.Counter()
+        self.recent_checks: collections.deque = collections.deque()
+        self.retries = 0
+        self.dead_lettered = 0
+
+    def observe_check(self, status: str, latency: float) -> None:
+        now = time.monotonic()
+        self.status_counts[status] += 1
+        self.latency_sum += latency
+        self.latency_count += 1
+
+        for index, bound in enumerate(self.LATENCY_BUCKETS):
+            if latency <= bound:
+                self.latency_buckets[index] += 1
+                break
+        else:
+            self.latency_buckets[-1] += 1
+
+        self.recent_checks.append(now)
+        while self.recent_checks[0] < now - self.RATE_WINDOW:
+            self.recent_checks.popleft()
+
+    def record_rate_limit(self, retry_after: float) -> None:
+        self.rate_limited += 1
+        self.rate_limit_wait += retry_after
+
+    def record_error(self, category: str) -> None:
+        self.errors[category] += 1
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage] += seconds
+        self.stage_calls[stage] += 1
+
+    @property
+    def checks_per_second(self) -> float:
+        now = time.monotonic()
+        while self.recent_checks and self.recent_checks[0] < now - self.RATE_WINDOW:
+            self.recent_checks.popleft()
+
+        window = min(self.RATE_WINDOW, now - self.started_at)
+        return len(self.recent_checks) / window if window > 0 else 0.0
+
+    def snapshot(self) -> Dict:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(list(self.LATENCY_BUCKETS) + ["+Inf"], self.latency_buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {
+            "uptime_s": round(time.monotonic() - self.started_at, 3),
+            "checks_total": sum(self.status_counts.values()),
+            "checks_per_second": round(self.checks_per_second, 3),
+            "status_counts": dict(self.status_counts),
+            "latency_seconds": {
+                "buckets": buckets,
+                "sum": round(self.latency_sum, 6),
+                "count": self.latency_count
+            },
+            "rate_limits": {
+                "count": self.rate_limited,
+                "wait_seconds": round(self.rate_limit_wait, 3)
+            },
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "dead_lettered": self.dead_lettered,
+            "stages": {
+                stage: {
+                    "calls": self.stage_calls[stage],
+                    "total_s": round(seconds, 6),
+                    "avg_ms": round(seconds / self.stage_calls[stage] * 1000, 3) if self.stage_calls[stage] else 0.0
+                }
+                for stage, seconds in self.stage_seconds.items()
+            }
+        }
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [
+            "# TYPE duck_checks_total counter",
+            *[f'duck_checks_total{{status="{status}"}} {count}' for status, count in snapshot["status_counts"].items()],
+            "# TYPE duck_checks_per_second gauge",
+            f"duck_checks_per_second {snapshot['checks_per_second']}",
+            "# TYPE duck_request_latency_seconds histogram",
+            *[f'duck_request_latency_seconds_bucket{{le="{bound}"}} {count}' for bound, count in snapshot["latency_seconds"]["buckets"].items()],
+            f"duck_request_latency_seconds_sum {snapshot['latency_seconds']['sum']}",
+            f"duck_request_latency_seconds_count {snapshot['latency_seconds']['count']}",
+            "# TYPE duck_rate_limited_total counter",
+            f"duck_rate_limited_total {self.rate_limited}",
+            "# TYPE duck_rate_limit_wait_seconds_total counter",
+            f"duck_rate_limit_wait_seconds_total {snapshot['rate_limits']['wait_seconds']}",
+            "# TYPE duck_errors_total counter",
+            *[f'duck_errors_total{{category="{category}"}} {count}' for category, count in snapshot["errors"].items()],
+            "# TYPE duck_retries_total counter",
+            f"duck_retries_total {self.retries}",
+            "# TYPE duck_dead_lettered_total counter",
+            f"duck_dead_lettered_total {self.dead_lettered}",
+            "# TYPE duck_stage_seconds_total counter",
+            *[f'duck_stage_seconds_total{{stage="{stage}"}} {values["total_s"]}' for stage, values in snapshot["stages"].items()],
+            "# TYPE duck_stage_calls_total counter",
+            *[f'duck_stage_calls_total{{stage="{stage}"}} {values["calls"]}' for stage, values in snapshot["stages"].items()]
+        ]
+        return "\n".join(lines) + "\n"
+
+@dataclass
+class CheckResult:
+    TRANSIENT_CATEGORIES = frozenset({"timeout", "network", "server", "parse", "rate_limit"})
+
+    username: str
+    status: str
+    latency: float
+    error: Optional[str] = None
+    category: Optional[str] = None
+
+    @property
+    def transient(self) -> bool:
+        return self.category in self.TRANSIENT_CATEGORIES
+
+class AuthenticationError(Exception):
+    pass
+
+class RateLimitPacer:
+    SAFETY_MARGIN = 0.05
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval = min_interval
+        self.next_request_at = 0.0
+        self.bucket: Optional[str] = None
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_after: Optional[float] = None
+
+    async def wait(self) -> None:
+        delay = self.next_request_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers) -> None:
+        now = time.monotonic()
+        spacing = self.min_interval
+
+        try:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset_after = headers.get("X-RateLimit-Reset-After")
+            limit = headers.get("X-RateLimit-Limit")
+
+            self.bucket = headers.get("X-RateLimit-Bucket", self.bucket)
+            self.limit = int(limit) if limit is not None else self.limit
+
+            if remaining is not None and reset_after is not None:
+                self.remaining = int(remaining)
+                self.reset_after = float(reset_after)
+
+                if self.remaining <= 0:
+                    spacing = max(spacing, self.reset_after + self.SAFETY_MARGIN)
+                else:
+                    spacing = max(spacing, self.reset_after / self.remaining)
+        except ValueError:
+            pass
+
+        self.next_request_at = max(self.next_request_at, now + spacing)
+
+    def penalize(self, retry_after: float) -> None:
+        self.next_request_at = max(self.next_request_at, time.monotonic() + retry_after + self.SAFETY_MARGIN)
+
 class DiscordAPI:
     BASE_URL = "https://discord.com/api/v9"
-    POMELO_ENDPOINT = f"{BASE_URL}/users/@me/pomelo-attempt"
-    USER_ENDPOINT = f"{BASE_URL}/users/@me"
+    POMELO_PATH = "/users/@me/pomelo-attempt"
+    USER_PATH = "/users/@me"
+    CONNECTION_LIMIT = 10
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 60
 
-    def __init__(self, config: Configuration):
+    def __init__(self, config: Configuration, metrics: Optional[Metrics] = None):
         self.config = config
+        self.metrics = metrics or Metrics()
         self.session: Optional[aiohttp.ClientSession] = None
+        self.base_url = (config.api_base_url or self.BASE_URL).rstrip("/")
+        self.pomelo_endpoint = f"{self.base_url}{self.POMELO_PATH}"
+        self.user_endpoint = f"{self.base_url}{self.USER_PATH}"
         self.current_token_index = 0
         self.tokens = self._load_tokens() if config.multi_token_mode else [config.discord_token]
+        self.pacers = [RateLimitPacer(config.request_delay) for _ in self.tokens]
+        self.headers = [
+            {
+                "Content-Type": "application/json",
+                "Origin": "https://discord.com",
+                "Authorization": token
+            }
+            for token in self.tokens
+        ]
 
     def _load_tokens(self) -> List[str]:
         try:
@@ -202,71 +486,145 @@ class DiscordAPI:
             Display.print_status("tokens.txt not found, using single token mode", "warning")
             return [self.config.discord_token]
 
+    async def open(self) -> None:
+        import aiohttp
+
+        if self.session and not self.session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.CONNECTION_LIMIT,
+            ttl_dns_cache=self.DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.request_timeout)
+        )
+
+    async def close(self) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self.open()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
 
     def _get_headers(self) -> Dict[str, str]:
-        return {
-            "Content-Type": "application/json",
-            "Origin": "https://discord.com",
-            "Authorization": self.tokens[self.current_token_index]
-        }
+        return self.headers[self.current_token_index]
+
+    async def check(self, username: str) -> CheckResult:
+        is_available, error, category, latency = await self._attempt_check(username)
+        status = "error" if error else "available" if is_available else "taken"
+        return CheckResult(username, status, latency, error, category)
 
     async def check_username_availability(self, username: str) -> Tuple[bool, Optional[str]]:
-        payload = {"username": username}
+        is_available, error, _, _ = await self._attempt_check(username)
+        return bool(is_available), error
 
+    async def _attempt_check(self, username: str) -> Tuple[Optional[bool], Optional[str], Optional[str], float]:
+        payload = json_dumps_bytes({"username": username})
+        latency = 0.0
+
+        for _ in range(self.config.max_retries + 1):
+            pacer = self.pacers[self.current_token_index]
+            waiting_since = time.perf_counter()
+            await pacer.wait()
+            self.metrics.record_stage("pacing", time.perf_counter() - waiting_since)
+
+            started = time.perf_counter()
+            outcome = await self._post_check(payload, pacer)
+            latency += time.perf_counter() - started
+
+            if outcome is not None:
+                return outcome + (latency,)
+
+        self.metrics.record_error("rate_limit")
+        return None, f"Rate limited, gave up after {self.config.max_retries} retries", "rate_limit", latency
+
+    async def _post_check(self, payload: bytes,
+                          pacer: RateLimitPacer) -> Optional[Tuple[Optional[bool], Optional[str], Optional[str]]]:
         try:
             async with self.session.post(
-                self.POMELO_ENDPOINT,
+                self.pomelo_endpoint,
                 headers=self._get_headers(),
-                json=payload
+                data=payload
             ) as response:
+                pacer.update(response.headers)
 
                 if response.status == 429:
-                    return await self._handle_rate_limit_and_retry(response, username)
+                    await self._handle_rate_limit(response, pacer)
+                    return None
 
                 try:
-                    data = await response.json()
-                except:
-                    return False, "Failed to parse response"
-
-                if data.get("taken") is not None:
-                    return not data["taken"], None
+                    data = json_loads(await response.read())
+                except Exception:
+                    data = None
+
+                if response.status >= 500:
+                    category = "server"
+                elif response.status in (401, 403):
+                    category = "auth"
+                elif not isinstance(data, dict):
+                    category = "parse"
+                elif data.get("taken") is not None:
+                    return not data["taken"], None, None
+                elif response.status == 400 or data.get("code") == 50035:
+                    category = "invalid"
                 else:
-                    error_msg = data.get("message", "Unknown error")
-                    return False, error_msg
+                    category = "api"
+
+                self.metrics.record_error(category)
+                if not isinstance(data, dict):
+                    return None, f"Failed to parse response (HTTP {response.status})", category
+                return None, data.get("message", "Unknown error"), category
 
+        except asyncio.TimeoutError:
+            self.metrics.record_error("timeout")
+            return None, "Request timed out", "timeout"
         except Exception as error:
-            return False, str(error)
+            category = self._categorize_error(error)
+            self.metrics.record_error(category)
+            return None, str(error), category
+
+    @staticmethod
+    def _categorize_error(error: Exception) -> str:
+        import aiohttp
+
+        return "network" if isinstance(error, aiohttp.ClientError) else "other"
+
+    async def _handle_rate_limit(self, response: aiohttp.ClientResponse, pacer: RateLimitPacer) -> None:
+        try:
+            data = json_loads(await response.read())
+            retry_after = float(data.get("retry_after", 5))
+        except:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 5))
+            except ValueError:
+                retry_after = 5
+
+        pacer.penalize(retry_after)
+        self.metrics.record_rate_limit(retry_after)
 
-    async def _handle_rate_limit_and_retry(self, response: aiohttp.ClientResponse, username: str) -> Tuple[bool, Optional[str]]:
         if self.config.multi_token_mode and len(self.tokens) > 1:
             old_index = self.current_token_index
-            self.current_token_index = (self.current_token_index + 1) % len(self.tokens)
+            self.current_token_index = min(range(len(self.pacers)), key=lambda index: self.pacers[index].next_request_at)
 
             if self.current_token_index != old_index:
                 Display.print_status(f"Switched to token {self.current_token_index + 1}/{len(self.tokens)}", "warning")
-                return await self.check_username_availability(username)
-
-        try:
-            data = await response.json()
-            retry_after = data.get("retry_after", 5)
-        except:
-            retry_after = 5
+                return
 
         Display.print_status(f"Rate limited, waiting {retry_after} seconds", "warning")
-        await asyncio.sleep(retry_after)
-        return await self.check_username_availability(username)
 
     async def get_current_user(self) -> Optional[Dict]:
         try:
             async with self.session.get(
-                self.USER_ENDPOINT,
+                self.user_endpoint,
                 headers=self._get_headers()
             ) as response:
                 if response.status == 200:
@@ -276,6 +634,34 @@ class DiscordAPI:
             Display.print_status(f"Failed to get user info: {error}", "error")
             return None
 
+class KeyspacePermutation:
+    ROUNDS = 4
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.half_bits = max(((size - 1).bit_length() + 1) // 2, 1)
+        self.half_mask = (1 << self.half_bits) - 1
+
+        rng = random.Random(seed)
+        key_bits = self.half_bits * 2
+        self.round_keys = [(rng.getrandbits(key_bits), rng.getrandbits(key_bits) | 1) for _ in range(self.ROUNDS)]
+
+    def _encrypt(self, value: int) -> int:
+        half_bits, half_mask = self.half_bits, self.half_mask
+        left, right = value >> half_bits, value & half_mask
+
+        for offset, multiplier in self.round_keys:
+            mixed = (right + offset) * multiplier
+            left, right = right, left ^ ((mixed >> half_bits) ^ (mixed >> (half_bits * 2))) & half_mask
+
+        return (left << half_bits) | right
+
+    def apply(self, position: int) -> int:
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
 class UsernameGenerator:
     def __init__(self, config: Configuration):
         self.config = config
@@ -304,16 +690,582 @@ class UsernameGenerator:
     def generate_batch(self, count: int, length: int) -> List[str]:
         return [self.generate(length) for _ in range(count)]
 
+    def keyspace_size(self, length: int) -> int:
+        return len(self.character_pool) ** length
+
+    def name_at(self, index: int, length: int) -> str:
+        base = len(self.character_pool)
+        chars = []
+
+        for _ in range(length):
+            index, digit = divmod(index, base)
+            chars.append(self.character_pool[digit])
+
+        return ''.join(reversed(chars))
+
+    def index_of(self, username: str) -> int:
+        base = len(self.character_pool)
+        index = 0
+
+        for char in username:
+            index = index * base + self.character_pool.index(char)
+
+        return index
+
+    def keyspace_indices(self, length: int, order: str = "permutation", start: int = 0, seed: Optional[int] = None) -> Iterator[int]:
+        if not 2 <= length <= 32:
+            raise ValueError("Username length must be between 2 and 32 characters")
+
+        size = self.keyspace_size(length)
+
+        if order == "lexicographic":
+            return iter(range(start, size))
+        elif order == "permutation":
+            return map(KeyspacePermutation(size, seed).apply, range(start, size))
+
+        raise ValueError(f"Unknown enumeration order: {order}")
+
+    def enumerate_keyspace(self, length: int, order: str = "permutation", start: int = 0, seed: Optional[int] = None) -> Iterator[str]:
+        for index in self.keyspace_indices(length, order, start, seed):
+            yield self.name_at(index, length)
+
+class BloomFilter:
+    MAX_BITS = 1 << 30
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.bit_count = min(max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8), self.MAX_BITS)
+        self.hash_count = max(int(round(self.bit_count / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+    def add(self, item: str) -> bool:
+        digest = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest(), 'little')
+        position = digest % self.bit_count
+        step = (digest >> 64) % self.bit_count | 1
+        bits = self.bits
+        added = False
+
+        for _ in range(self.hash_count):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+
+            position += step
+            if position >= self.bit_count:
+                position -= self.bit_count
+
+        return added
+
+class PatternGenerator:
+    TOKEN_PATTERN = re.compile(r"\?[ldsa?]|\{word\}|.")
+    LEET_TABLE = str.maketrans("aeiost", "431057")
+
+    def __init__(self, generator: UsernameGenerator, words: Sequence[str] = (), leet: bool = False,
+                 prefixes: Sequence[str] = (), suffixes: Sequence[str] = ()):
+        self.charsets = {
+            "?l": string.ascii_lowercase,
+            "?d": string.digits,
+            "?s": "_.",
+            "?a": generator.character_pool,
+            "??": "?"
+        }
+        self.words = list(dict.fromkeys(word.strip().lower() for word in words if word.strip()))
+        self.leet = leet
+        self.prefixes = list(prefixes)
+        self.suffixes = list(suffixes)
+        self.duplicates_skipped = 0
+
+    @staticmethod
+    def load_wordlist(path: Path) -> List[str]:
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            return [line.strip() for line in file if line.strip()]
+
+    def compile(self, template: str) -> List[Sequence[str]]:
+        slots = []
+
+        for token in self.TOKEN_PATTERN.findall(template):
+            if token == "{word}":
+                if not self.words:
+                    raise ValueError(f"Pattern '{template}' uses {{word}} but no wordlist is loaded")
+                slots.append(self.words)
+            else:
+                slots.append(self.charsets.get(token, token))
+
+        return slots
+
+    @property
+    def variants_per_candidate(self) -> int:
+        return (2 if self.leet else 1) * (1 + len(self.prefixes) + len(self.suffixes))
+
+    def count(self, templates: Sequence[str]) -> int:
+        total = sum(math.prod(len(slot) for slot in self.compile(template)) for template in templates)
+        return total * self.variants_per_candidate
+
+    def _mutate(self, candidate: str) -> Iterator[str]:
+        bases = (candidate, candidate.translate(self.LEET_TABLE)) if self.leet else (candidate,)
+
+        for base in bases:
+            yield base
+            for prefix in self.prefixes:
+                yield prefix + base
+            for suffix in self.suffixes:
+                yield base + suffix
+
+    def candidates(self, templates: Sequence[str], limit: Optional[int] = None) -> Iterator[str]:
+        compiled = [self.compile(template) for template in templates]
+        capacity = self.count(templates) if limit is None else min(self.count(templates), limit)
+        distinct = (len(compiled) == 1 and self.variants_per_candidate == 1
+                    and sum(slot is self.words for slot in compiled[0]) <= 1)
+        seen = None if distinct else BloomFilter(capacity)
+
+        for slots in compiled:
+            for parts in itertools.product(*slots):
+                for candidate in self._mutate(''.join(parts)):
+                    if seen is None or seen.add(candidate):
+                        yield candidate
+                    else:
+                        self.duplicates_skipped += 1
+
+class KeyspaceCoverage:
+    UNCHECKED = 0
+    TAKEN = 1
+    AVAILABLE = 2
+    ERROR = 3
+    STATUS_CODES = {"taken": TAKEN, "available": AVAILABLE, "error": ERROR}
+    MAX_KEYSPACE = 2 ** 26
+
+    def __init__(self, generator: UsernameGenerator, length: int, directory: Path = Path("coverage")):
+        self.generator = generator
+        self.length = length
+        self.size = generator.keyspace_size(length)
+
+        digest = hashlib.sha1(f"{generator.character_pool}:{length}".encode()).hexdigest()[:16]
+        self.seed = int(digest, 16)
+        self.path = directory / f"keyspace_{length}_{digest}.bin"
+        self.counts_path = self.path.with_suffix(".json")
+
+        self.file = None
+        self.map: Optional[mmap.mmap] = None
+        self.counts = [self.size, 0, 0, 0]
+        self.invalid = 0
+
+    @classmethod
+    def supports(cls, generator: UsernameGenerator, length: int) -> bool:
+        return generator.keyspace_size(length) <= cls.MAX_KEYSPACE
+
+    def __enter__(self):
+        byte_size = (self.size + 3) // 4
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a+b')
+        existing_size = self.file.seek(0, 2)
+        if existing_size < byte_size:
+            self.file.truncate(byte_size)
+
+        self.map = mmap.mmap(self.file.fileno(), byte_size)
+        if existing_size:
+            self._load_counts()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.map:
+            self.map.flush()
+            self.map.close()
+            self.map = None
+
+            temporary_path = self.counts_path.with_suffix(".tmp")
+            temporary_path.write_text(json.dumps({"counts": self.counts, "invalid": self.invalid}))
+            os.replace(temporary_path, self.counts_path)
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def _load_counts(self) -> None:
+        try:
+            saved = json.loads(self.counts_path.read_text())
+            self.counts_path.unlink()
+            counts, invalid = saved["counts"], int(saved["invalid"])
+        except (OSError, ValueError, TypeError, KeyError):
+            counts, invalid = None, 0
+
+        if not isinstance(counts, list) or len(counts) != 4 or sum(counts) != self.size:
+            counts = self._scan()
+            invalid = self._scan_invalid() if counts[self.TAKEN] else 0
+
+        self.counts, self.invalid = counts, invalid
+
+    def _scan(self) -> List[int]:
+        counts = [0, 0, 0, 0]
+        chunk_size = 1 << 20
+
+        for start in range(0, len(self.map), chunk_size):
+            for value, occurrences in collections.Counter(self.map[start:start + chunk_size]).items():
+                if value:
+                    for slot in range(4):
+                        counts[(value >> (slot << 1)) & 3] += occurrences
+
+        counts[self.UNCHECKED] = self.size - counts[self.TAKEN] - counts[self.AVAILABLE] - counts[self.ERROR]
+        return counts
+
+    def _scan_invalid(self) -> int:
+        invalid = 0
+
+        for match in re.finditer(b"[^\x00]", self.map):
+            position, value = match.start(), match.group()[0]
+            for slot in range(4):
+                if (value >> (slot << 1)) & 3 == self.TAKEN:
+                    username = self.generator.name_at((position << 2) + slot, self.length)
+                    if not UsernameValidator.PATTERN.match(username):
+                        invalid += 1
+
+        return invalid
+
+    def get(self, index: int) -> int:
+        return (self.map[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def set(self, index: int, status: int) -> None:
+        shift = (index & 3) << 1
+        position = index >> 2
+        current = self.map[position]
+
+        self.counts[(current >> shift) & 3] -= 1
+        self.counts[status] += 1
+        self.map[position] = (current & ~(3 << shift)) | (status << shift)
+
+    def record(self, username: str, status: str) -> None:
+        index = self.generator.index_of(username)
+
+        if status == "invalid":
+            if self.get(index) != self.TAKEN:
+                self.invalid += 1
+            status = "taken"
+
+        self.set(index, self.STATUS_CODES[status])
+
+    def pending(self, indices: Iterable[int]) -> Iterator[str]:
+        for index in indices:
+            if self.get(index) in (self.UNCHECKED, self.ERROR):
+                yield self.generator.name_at(index, self.length)
+
+    def report(self) -> Dict[str, int]:
+        return {
+            "keyspace": self.size,
+            "taken": self.counts[self.TAKEN] - self.invalid,
+            "available": self.counts[self.AVAILABLE],
+            "invalid": self.invalid,
+            "error": self.counts[self.ERROR],
+            "unchecked": self.counts[self.UNCHECKED],
+            "coverage_file": str(self.path)
+        }
+
+class UsernameValidator:
+    PATTERN = re.compile(r"^(?!.*\.\.)[a-z0-9_.]{2,32}$")
+
+    def __init__(self, capacity: int = 5000000, error_rate: float = 0.001):
+        self.seen = BloomFilter(capacity, error_rate)
+        self.rejected_invalid = 0
+        self.rejected_duplicate = 0
+
+    def normalize(self, username: str) -> Optional[str]:
+        username = username.strip().lower()
+
+        if not self.PATTERN.match(username):
+            self.rejected_invalid += 1
+            return None
+
+        if not self.seen.add(username):
+            self.rejected_duplicate += 1
+            return None
+
+        return username
+
+    @property
+    def requests_saved(self) -> int:
+        return self.rejected_invalid + self.rejected_duplicate
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "rejected_invalid": self.rejected_invalid,
+            "rejected_duplicate": self.rejected_duplicate,
+            "requests_saved": self.requests_saved
+        }
+
+class UsernameFileReader:
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        self.lines_read = 0
+
+    def _open(self, path: str):
+        if path == "-":
+            return sys.stdin.buffer
+        if path.endswith(".gz"):
+            return gzip.open(path, 'rb')
+        return open(path, 'rb')
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+
+        for path in self.paths:
+            file = self._open(path)
+            read = getattr(file, 'read1', file.read)
+            remainder = b""
+
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, read, self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+
+                    lines = (remainder + chunk).split(b"\n")
+                    remainder = lines.pop()
+
+                    for line in lines:
+                        username = line.strip().decode('utf-8', errors='replace')
+                        if username:
+                            self.lines_read += 1
+                            yield username
+
+                username = remainder.strip().decode('utf-8', errors='replace')
+                if username:
+                    self.lines_read += 1
+                    yield username
+            finally:
+                if file is not sys.stdin.buffer:
+                    file.close()
+
+class ResultCache:
+    COMMIT_INTERVAL = 100
+
+    def __init__(self, config: Configuration):
+        self.path = Path(config.cache_file)
+        self.ttls = {
+            "taken": config.cache_ttl_taken,
+            "available": config.cache_ttl_available,
+            "error": config.cache_ttl_error
+        }
+        self.connection: Optional[sqlite3.Connection] = None
+        self.pending_writes = 0
+        self.hits = 0
+
+    def __enter__(self):
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "username TEXT PRIMARY KEY, "
+            "status TEXT NOT NULL, "
+            "checked_at REAL NOT NULL, "
+            "error TEXT"
+            ") WITHOUT ROWID"
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.connection:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+    def lookup(self, username: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT status, checked_at FROM results WHERE username = ?", (username,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        status, checked_at = row
+        if time.time() - checked_at >= self.ttls.get(status, 0):
+            return None
+
+        self.hits += 1
+        return status
+
+    def summary(self) -> Dict[str, int]:
+        return dict(self.connection.execute("SELECT status, COUNT(*) FROM results GROUP BY status").fetchall())
+
+    def store(self, username: str, status: str, error: Optional[str] = None) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results (username, status, checked_at, error) VALUES (?, ?, ?, ?)",
+            (username, status, time.time(), error)
+        )
+
+        self.pending_writes += 1
+        if self.pending_writes >= self.COMMIT_INTERVAL:
+            self.connection.commit()
+            self.pending_writes = 0
+
+class ResultWriter:
+    CSV_FIELDS = ["username", "status", "timestamp", "latency_ms", "error"]
+
+    def __init__(self, path: Path, output_format: str = "txt", batch_size: int = 100, flush_interval: float = 1.0,
+                 mode: str = "a"):
+        self.path = path
+        self.output_format = output_format
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def _format_batch(self, batch: List[Dict]) -> str:
+        if self.output_format == "jsonl":
+            return ''.join(json.dumps(record) + "\n" for record in batch)
+
+        if self.output_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=self.CSV_FIELDS, extrasaction='ignore')
+            writer.writerows(batch)
+            return buffer.getvalue()
+
+        return ''.join(f"{record['username']}\n" for record in batch)
+
+    async def start(self) -> None:
+        if self.task is None:
+            self.queue = asyncio.Queue(maxsize=self.batch_size * 10)
+            self.task = asyncio.create_task(self._run())
+
+    async def write(self, record: Dict) -> None:
+        await self._put(record)
+
+    async def close(self) -> None:
+        if self.task is None:
+            return
+
+        try:
+            await self._put(None)
+            await self.task
+        finally:
+            self.task = None
+
+    async def _put(self, item: Optional[Dict]) -> None:
+        if not self.task.done():
+            if not self.queue.full():
+                self.queue.put_nowait(item)
+                return
+
+            put = asyncio.ensure_future(self.queue.put(item))
+            await asyncio.wait({put, self.task}, return_when=asyncio.FIRST_COMPLETED)
+            if put.done():
+                return
+            put.cancel()
+
+        self.task.result()
+        raise RuntimeError(f"Writer for {self.path} stopped unexpectedly")
+
+    async def _run(self) -> None:
+        import aiofiles
+
+        loop = asyncio.get_running_loop()
+        needs_header = self.output_format == "csv" and (self.mode == "w" or not self.path.exists() or self.path.stat().st_size == 0)
+        closing = False
+
+        async with aiofiles.open(self.path, self.mode, newline='') as file:
+            if needs_header:
+                await file.write(','.join(self.CSV_FIELDS) + "\r\n")
+
+            while not closing:
+                record = await self.queue.get()
+                if record is None:
+                    break
+
+                batch = [record]
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.batch_size:
+                    if self.queue.empty():
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            record = await asyncio.wait_for(self.queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    else:
+                        record = self.queue.get_nowait()
+
+                    if record is None:
+                        closing = True
+                        break
+                    batch.append(record)
+
+                await file.write(self._format_batch(batch))
+                await file.flush()
+
 class ResultManager:
-    def __init__(self, output_file: Path = Path("available_usernames.txt")):
+    def __init__(self, output_file: Path = Path("available_usernames.txt"), results_file: Optional[Path] = None,
+                 results_format: str = "jsonl", batch_size: int = 100, flush_interval: float = 1.0,
+                 dead_letter_file: Path = Path("dead_letter.txt")):
         self.output_file = output_file
+        self.results_file = results_file
+        self.dead_letter_file = dead_letter_file
+        self.dead_lettered = 0
+        self.run_dead_lettered = 0
         self.available_usernames: List[str] = []
         self.total_checked = 0
 
+        self.available_writer = ResultWriter(output_file, "txt", batch_size, flush_interval)
+        self.results_writer = ResultWriter(results_file, results_format, batch_size, flush_interval) if results_file else None
+        self.dead_letter_writer = ResultWriter(dead_letter_file.with_name(dead_letter_file.name + ".partial"), "txt",
+                                               batch_size, flush_interval, mode="w")
+
+    @classmethod
+    def from_config(cls, config: Configuration) -> "ResultManager":
+        results_file = Path(config.results_file) if config.results_format in ("jsonl", "csv") and config.results_file else None
+        return cls(
+            results_file=results_file,
+            results_format=config.results_format,
+            batch_size=config.write_batch_size,
+            flush_interval=config.write_flush_interval,
+            dead_letter_file=Path(config.dead_letter_file)
+        )
+
+    async def start(self) -> None:
+        self.run_dead_lettered = 0
+        await self.available_writer.start()
+        if self.results_writer:
+            await self.results_writer.start()
+
+    async def close(self) -> None:
+        writers = [self.available_writer, self.dead_letter_writer, self.results_writer]
+        outcomes = await asyncio.gather(*(writer.close() for writer in writers if writer), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        if self.run_dead_lettered:
+            os.replace(self.dead_letter_writer.path, self.dead_letter_file)
+        elif self.dead_letter_file.exists():
+            self.dead_letter_file.unlink()
+
+    async def dead_letter(self, username: str) -> None:
+        self.dead_lettered += 1
+        self.run_dead_lettered += 1
+        await self.dead_letter_writer.start()
+        await self.dead_letter_writer.write({"username": username})
+
     async def save_username(self, username: str) -> None:
         self.available_usernames.append(username)
-        async with aiofiles.open(self.output_file, 'a') as file:
-            await file.write(f"{username}\n")
+        await self.available_writer.write({"username": username})
+
+    async def record(self, username: str, status: str, latency: float, error: Optional[str] = None) -> None:
+        self.increment_checked()
+
+        if status == "available":
+            await self.save_username(username)
+
+        if self.results_writer:
+            await self.results_writer.write({
+                "username": username,
+                "status": status,
+                "timestamp": datetime.utcnow().isoformat(),
+                "latency_ms": round(latency * 1000, 1),
+                "error": error
+            })
 
     def increment_checked(self):
         self.total_checked += 1
@@ -322,44 +1274,466 @@ class ResultManager:
         return {
             "total_available": len(self.available_usernames),
             "total_checked": self.total_checked,
+            "dead_lettered": self.dead_lettered,
             "output_file": str(self.output_file)
         }
 
 class WebhookNotifier:
+    MAX_EMBEDS = 10
+    FLUSH_INTERVAL = 1.0
+    MAX_RETRIES = 5
+
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
         self.enabled = bool(webhook_url)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.enabled and self.task is None:
+            import aiohttp
+
+            self.session = aiohttp.ClientSession()
+            self.queue = asyncio.Queue()
+            self.task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self.task is None:
+            return
+
+        self.queue.put_nowait(None)
+        await self.task
+        await self.session.close()
+        self.task = None
+        self.session = None
 
     async def notify_available_username(self, username: str) -> None:
         if not self.enabled:
             return
 
+        await self.start()
+        self.queue.put_nowait({
+            "title": f"Username Available: {username}",
+            "color": 0x00ff00,
+            "timestamp": datetime.utcnow().isoformat(),
+            "footer": {"text": "DUCK v1.0"}
+        })
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+
+        while not closing:
+            embed = await self.queue.get()
+            if embed is None:
+                break
+
+            embeds = [embed]
+            deadline = loop.time() + self.FLUSH_INTERVAL
+
+            while len(embeds) < self.MAX_EMBEDS:
+                try:
+                    embed = await asyncio.wait_for(self.queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+
+                if embed is None:
+                    closing = True
+                    break
+                embeds.append(embed)
+
+            await self._send(embeds)
+
+    async def _send(self, embeds: List[Dict]) -> None:
         payload = {
             "username": "DUCK - Username Checker",
-            "embeds": [{
-                "title": f"Username Available: {username}",
-                "color": 0x00ff00,
-                "timestamp": datetime.utcnow().isoformat(),
-                "footer": {"text": "DUCK v1.0"}
-            }]
+            "embeds": embeds
         }
 
+        for _ in range(self.MAX_RETRIES + 1):
+            try:
+                async with self.session.post(self.webhook_url, json=payload) as response:
+                    if response.status == 429:
+                        try:
+                            retry_after = float((await response.json()).get("retry_after", 1))
+                        except:
+                            retry_after = 1.0
+                        await asyncio.sleep(retry_after)
+                        continue
+
+                    if response.status in (200, 204):
+                        Display.print_status(f"Webhook sent for {len(embeds)} username(s)", "success")
+                    else:
+                        Display.print_status(f"Webhook failed with status {response.status}", "error")
+                    return
+            except Exception as error:
+                Display.print_status(f"Webhook failed: {error}", "error")
+                return
+
+        Display.print_status("Webhook rate limited, dropped notification", "error")
+
+class MetricsExporter:
+    def __init__(self, metrics: Metrics, config: Configuration):
+        self.metrics = metrics
+        self.metrics_file = Path(config.metrics_file) if config.metrics_file else None
+        self.interval = config.metrics_interval
+        self.port = config.metrics_port
+        self.task: Optional[asyncio.Task] = None
+        self.runner = None
+
+    async def start(self) -> None:
+        if self.metrics_file and self.task is None:
+            self.task = asyncio.create_task(self._run())
+
+        if self.port and self.runner is None:
+            from aiohttp import web
+
+            app = web.Application()
+            app.router.add_get("/metrics", self._handle_metrics)
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            await web.TCPSite(self.runner, "127.0.0.1", self.port).start()
+            Display.print_status(f"Metrics available at http://127.0.0.1:{self.port}/metrics", "info")
+
+    async def close(self) -> None:
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+            self.write()
+
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def _handle_metrics(self, request):
+        from aiohttp import web
+        return web.Response(text=self.metrics.to_prometheus(), content_type="text/plain")
+
+    def write(self) -> None:
+        temporary = self.metrics_file.with_name(self.metrics_file.name + ".tmp")
+        temporary.write_text(json.dumps(self.metrics.snapshot(), indent=2))
+        os.replace(temporary, self.metrics_file)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.write()
+
+class RunProfiler:
+    def __init__(self, config: Configuration):
+        self.mode = config.profile_mode
+        self.output = config.profile_file
+        self.profiler: Optional[cProfile.Profile] = None
+
+    def __enter__(self):
+        if self.mode == "cprofile":
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        elif self.mode == "tracemalloc":
+            tracemalloc.start(25)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.profiler:
+            self.profiler.disable()
+            self.profiler.dump_stats(f"{self.output}.prof")
+            self.profiler = None
+            Display.print_status(f"cProfile stats written to {self.output}.prof", "info")
+        elif self.mode == "tracemalloc" and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            with open(f"{self.output}.txt", 'w') as file:
+                file.write(f"current={current} peak={peak}\n")
+                for stat in snapshot.statistics('lineno')[:50]:
+                    file.write(f"{stat}\n")
+            Display.print_status(f"tracemalloc snapshot written to {self.output}.txt", "info")
+
+class ConsoleRenderer:
+    MODES = ("auto", "live", "plain", "quiet", "full")
+    RECENT_HITS = 5
+
+    def __init__(self, mode: str = "auto", refresh_rate: float = 4.0, metrics: Optional[Metrics] = None):
+        if mode not in self.MODES or mode == "auto":
+            mode = "live" if sys.stdout.isatty() else "plain"
+
+        self.mode = mode
+        self.interval = 1 / refresh_rate if refresh_rate > 0 else 0.25
+        self.metrics = metrics or Metrics()
+        self.counts: Dict[str, int] = collections.Counter()
+        self.recent_hits: collections.deque = collections.deque(maxlen=self.RECENT_HITS)
+        self.block_lines = 0
+        self.dirty = False
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.mode == "live" and self.task is None:
+            Display.live_renderer = self
+            self.task = asyncio.create_task(self._refresh_loop())
+
+    async def close(self) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.webhook_url, json=payload) as response:
-                    if response.status == 204:
-                        Display.print_status(f"Webhook sent for {username}", "success")
-        except Exception as error:
-            Display.print_status(f"Webhook failed: {error}", "error")
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+        self.task = None
+        self.render()
+        self.block_lines = 0
+        Display.live_renderer = None
+
+    def handle(self, result: CheckResult) -> None:
+        self.counts[result.status] += 1
+        self.dirty = True
+
+        if result.status == "available":
+            self.recent_hits.append(result.username)
+
+        if self.mode == "quiet":
+            return
+
+        if self.mode == "full":
+            if result.error:
+                Display.print_status(f"Error checking '{result.username}': {result.error}", "error")
+            else:
+                Display.print_username_result(result.username, result.status == "available")
+        elif self.mode == "plain":
+            if result.error:
+                self._write_plain(f"ERROR {result.username}: {result.error}\n")
+            elif result.status == "available":
+                self._write_plain(f"AVAILABLE {result.username}\n")
+        elif result.error:
+            Display.print_status(f"Error checking '{result.username}': {result.error}", "error")
+        elif result.status == "available":
+            self.clear()
+            Display.print_username_result(result.username, True)
+
+    def _write_plain(self, line: str) -> None:
+        try:
+            sys.__stdout__.write(line)
+        except (BrokenPipeError, ValueError):
+            self.mode = "quiet"
+
+    def clear(self) -> None:
+        if self.block_lines:
+            sys.stdout.write(f"\x1b[{self.block_lines}F\x1b[J")
+            self.block_lines = 0
+            self.dirty = True
+
+    def render(self) -> None:
+        checked = sum(self.counts.values())
+        lines = [
+            f"{Fore.CYAN}[~] {Fore.WHITE}Checked {Fore.YELLOW}{checked:,}{Fore.WHITE} | "
+            f"Available {Fore.GREEN}{self.counts['available']:,}{Fore.WHITE} | "
+            f"Taken {Fore.RED}{self.counts['taken']:,}{Fore.WHITE} | "
+            f"Errors {Fore.YELLOW}{self.counts['error']:,}{Fore.WHITE} | "
+            f"{self.metrics.checks_per_second:.1f} checks/s{Style.RESET_ALL}",
+            f"{Fore.CYAN}[~] {Fore.WHITE}Recent hits: {Fore.GREEN}{', '.join(self.recent_hits) or '-'}{Style.RESET_ALL}"
+        ]
+
+        self.clear()
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        self.block_lines = len(lines)
+        self.dirty = False
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if self.dirty:
+                self.render()
+
+class CheckPipeline:
+    def __init__(self, api: DiscordAPI, cache: ResultCache, validator: UsernameValidator,
+                 result_manager: ResultManager, webhook_notifier: WebhookNotifier,
+                 coverage: Optional[KeyspaceCoverage] = None, queue_size: int = 256,
+                 metrics: Optional[Metrics] = None, max_retries: int = 3, retry_base_delay: float = 1.0,
+                 retry_max_delay: float = 30.0, retry_queue_size: int = 1000,
+                 renderer: Optional[ConsoleRenderer] = None):
+        self.api = api
+        self.cache = cache
+        self.validator = validator
+        self.result_manager = result_manager
+        self.webhook_notifier = webhook_notifier
+        self.coverage = coverage
+        self.queue_size = queue_size
+        self.metrics = metrics or api.metrics
+        self.renderer = renderer or ConsoleRenderer("full", metrics=self.metrics)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_queue_size = retry_queue_size
+        self.retry_attempts: Dict[str, int] = {}
+        self.retry_queue: List[Tuple[float, str]] = []
+        self.sinks = {
+            "store": self._store_sink,
+            "console": self._console_sink,
+            "file": self._file_sink,
+            "webhook": self._webhook_sink
+        }
+
+    async def run(self, usernames: AsyncIterator[str]) -> None:
+        candidates = asyncio.Queue(self.queue_size)
+        checks = asyncio.Queue(self.queue_size)
+        sink_queues = [asyncio.Queue(self.queue_size) for _ in self.sinks]
+
+        tasks = [
+            asyncio.create_task(self._source_stage(usernames, candidates)),
+            asyncio.create_task(self._validation_stage(candidates, checks)),
+            asyncio.create_task(self._check_stage(checks, sink_queues)),
+            *[asyncio.create_task(self._sink_stage(queue, name, sink)) for queue, (name, sink) in zip(sink_queues, self.sinks.items())]
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _source_stage(self, usernames: AsyncIterator[str], output: asyncio.Queue) -> None:
+        async for username in usernames:
+            await output.put(username)
+        await output.put(None)
+
+    async def _validation_stage(self, input: asyncio.Queue, output: asyncio.Queue) -> None:
+        while True:
+            raw_username = await input.get()
+            if raw_username is None:
+                break
+
+            started = time.perf_counter()
+            username = self.validator.normalize(raw_username)
+            cached_status = self.cache.lookup(username) if username else None
+            self.metrics.record_stage("validate", time.perf_counter() - started)
+
+            if username is None:
+                if self.coverage:
+                    self.coverage.record(raw_username, "invalid")
+                continue
+
+            if cached_status:
+                if self.coverage:
+                    self.coverage.record(username, cached_status)
+                continue
+
+            await output.put(username)
+
+        await output.put(None)
+
+    async def _next_check(self, input: asyncio.Queue, input_open: bool) -> Tuple[Optional[str], bool]:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if self.retry_queue and self.retry_queue[0][0] <= loop.time():
+                return heapq.heappop(self.retry_queue)[1], input_open
+
+            if not input_open:
+                if not self.retry_queue:
+                    return None, False
+                await asyncio.sleep(self.retry_queue[0][0] - loop.time())
+                continue
+
+            try:
+                timeout = self.retry_queue[0][0] - loop.time() if self.retry_queue else None
+                username = await asyncio.wait_for(input.get(), timeout)
+            except asyncio.TimeoutError:
+                continue
+
+            if username is None:
+                input_open = False
+                continue
+            return username, True
+
+    def _schedule_retry(self, result: CheckResult) -> bool:
+        attempt = self.retry_attempts.get(result.username, 0)
+        if attempt >= self.max_retries or len(self.retry_queue) >= self.retry_queue_size:
+            return False
+
+        self.retry_attempts[result.username] = attempt + 1
+        self.metrics.retries += 1
+
+        delay = min(self.retry_base_delay * 2 ** attempt, self.retry_max_delay) * random.uniform(0.5, 1.5)
+        heapq.heappush(self.retry_queue, (asyncio.get_running_loop().time() + delay, result.username))
+        return True
+
+    async def _check_stage(self, input: asyncio.Queue, outputs: List[asyncio.Queue]) -> None:
+        input_open = True
+
+        while True:
+            username, input_open = await self._next_check(input, input_open)
+            if username is None:
+                break
+
+            result = await self.api.check(username)
+            self.metrics.observe_check(result.status, result.latency)
+            self.metrics.record_stage("api", result.latency)
+
+            if result.category == "auth":
+                raise AuthenticationError(result.error)
+
+            if result.transient and self._schedule_retry(result):
+                continue
+
+            self.retry_attempts.pop(username, None)
+            if result.transient:
+                self.metrics.dead_lettered += 1
+                await self.result_manager.dead_letter(username)
+
+            for output in outputs:
+                await output.put(result)
+
+        for output in outputs:
+            await output.put(None)
+
+    async def _sink_stage(self, input: asyncio.Queue, name: str, sink) -> None:
+        while True:
+            result = await input.get()
+            if result is None:
+                break
+
+            started = time.perf_counter()
+            await sink(result)
+            self.metrics.record_stage(name, time.perf_counter() - started)
+
+    async def _store_sink(self, result: CheckResult) -> None:
+        if not result.transient:
+            self.cache.store(result.username, result.status, result.error)
+        if self.coverage:
+            self.coverage.record(result.username, result.status)
+
+    async def _console_sink(self, result: CheckResult) -> None:
+        self.renderer.handle(result)
+
+    async def _file_sink(self, result: CheckResult) -> None:
+        await self.result_manager.record(result.username, result.status, result.latency, result.error)
+
+    async def _webhook_sink(self, result: CheckResult) -> None:
+        if result.status == "available":
+            await self.webhook_notifier.notify_available_username(result.username)
 
 class UsernameChecker:
-    def __init__(self):
-        self.config_manager = ConfigManager()
+    ORDERS = {"shuffled": "permutation", "lexicographic": "lexicographic"}
+
+    def __init__(self, config_path: Path = Path("config.json")):
+        self.config_manager = ConfigManager(config_path)
         self.config: Optional[Configuration] = None
         self.discord_api: Optional[DiscordAPI] = None
         self.generator: Optional[UsernameGenerator] = None
-        self.result_manager = ResultManager()
+        self.result_manager: Optional[ResultManager] = None
         self.webhook_notifier: Optional[WebhookNotifier] = None
+        self.metrics = Metrics()
 
         logging.basicConfig(
             level=logging.ERROR,
@@ -371,22 +1745,130 @@ class UsernameChecker:
         self.config = await self.config_manager.load_or_create_config()
         self.generator = UsernameGenerator(self.config)
         self.webhook_notifier = WebhookNotifier(self.config.webhook_url)
+        self.result_manager = ResultManager.from_config(self.config)
+        await self._open_api()
+
+        if not await self._verify_token():
+            await self.discord_api.close()
+            sys.exit(1)
+
+    async def _open_api(self) -> None:
+        if self.discord_api:
+            await self.discord_api.close()
 
-        async with DiscordAPI(self.config) as api:
-            user_info = await api.get_current_user()
-            if not user_info:
-                Display.print_status("Invalid Discord token!", "error")
-                sys.exit(1)
+        self.discord_api = DiscordAPI(self.config, self.metrics)
+        await self.discord_api.open()
 
-            username = user_info.get('username', 'Unknown')
-            discriminator = user_info.get('discriminator', '0000')
-            Display.print_status(f"Connected as: {username}#{discriminator}", "success")
+    async def _verify_token(self) -> bool:
+        user_info = await self.discord_api.get_current_user()
+        if not user_info:
+            Display.print_status("Invalid Discord token!", "error")
+            return False
 
-            self.discord_api = api
+        username = user_info.get('username', 'Unknown')
+        discriminator = user_info.get('discriminator', '0000')
+        Display.print_status(f"Connected as: {username}#{discriminator}", "success")
+        return True
+
+    async def run_headless(self, args: argparse.Namespace) -> int:
+        try:
+            self.config = self.config_manager.load_without_prompt()
+        except (OSError, ValueError, TypeError) as error:
+            Display.print_status(f"Failed to load config: {error}", "error")
+            return 1
+
+        for name in Configuration.__dataclass_fields__:
+            value = getattr(args, name, None)
+            if value is not None:
+                setattr(self.config, name, value)
+
+        charset = getattr(args, "charset", None)
+        if charset:
+            self.config.enable_letters = "l" in charset
+            self.config.enable_numbers = "d" in charset
+            self.config.enable_symbols = "s" in charset
+
+        if args.command == "stats":
+            self._print_stored_stats()
+            return 0
+
+        if not self.config.discord_token:
+            Display.print_status("No Discord token configured, pass --token or set it in the config file", "error")
+            return 1
+
+        self.generator = UsernameGenerator(self.config)
+        self.webhook_notifier = WebhookNotifier(self.config.webhook_url)
+        self.result_manager = ResultManager.from_config(self.config)
+        await self._open_api()
+
+        try:
+            return await self._run_command(args)
+        finally:
+            await self.discord_api.close()
+
+    async def _run_command(self, args: argparse.Namespace) -> int:
+        if args.verify_token and not await self._verify_token():
+            return 1
+
+        if args.command == "check":
+            return 0 if await self._run_files(args.files or ["usernames.txt"]) else 1
+
+        if args.patterns:
+            words = PatternGenerator.load_wordlist(Path(args.wordlist)) if args.wordlist else []
+            patterns = PatternGenerator(self.generator, words, args.leet, args.prefixes, args.suffixes)
+            try:
+                Display.print_status(f"Pattern candidates: up to {patterns.count(args.patterns):,} (before deduplication)", "info")
+            except ValueError as error:
+                Display.print_status(str(error), "error")
+                return 2
+            await self._run_patterns(patterns, args.patterns, args.count)
+            return 0
+
+        if args.length is None or not 2 <= args.length <= 32:
+            Display.print_status("generate needs --length between 2 and 32 or at least one --pattern", "error")
+            return 2
+
+        Display.print_status(f"Keyspace size: {self.generator.keyspace_size(args.length):,} usernames", "info")
+        await self._run_generate(args.length, args.count, args.order)
+        return 0
+
+    def _print_stored_stats(self) -> None:
+        Display.print_section_header("STATS")
+
+        if Path(self.config.cache_file).exists():
+            with ResultCache(self.config) as cache:
+                for status, count in sorted(cache.summary().items()):
+                    Display.print_status(f"Cached {status}: {count:,}", "info")
+        else:
+            Display.print_status(f"No result cache at {self.config.cache_file}", "warning")
+
+        generator = UsernameGenerator(self.config)
+        for length in range(2, 33):
+            if not KeyspaceCoverage.supports(generator, length):
+                break
+
+            coverage = KeyspaceCoverage(generator, length)
+            if coverage.path.exists():
+                with coverage:
+                    Display.print_coverage_report(coverage.report())
+
+        metrics_file = Path(self.config.metrics_file) if self.config.metrics_file else None
+        if metrics_file and metrics_file.exists():
+            snapshot = json.loads(metrics_file.read_text())
+            Display.print_status(
+                f"Last run: {snapshot['checks_total']:,} checks, {snapshot['checks_per_second']} checks/s, "
+                f"{snapshot['rate_limits']['count']} rate limits, errors {snapshot['errors']}", "info"
+            )
 
     async def run(self) -> None:
         await self.initialize()
 
+        try:
+            await self._menu_loop()
+        finally:
+            await self.discord_api.close()
+
+    async def _menu_loop(self) -> None:
         while True:
             Display.print_menu()
             choice = input(f"\n{Fore.WHITE}Select option {Fore.CYAN}[1-5]: {Fore.YELLOW}").strip()
@@ -408,6 +1890,7 @@ class UsernameChecker:
     async def _reconfigure(self) -> None:
         await self.config_manager._create_new_config()
         self.config = self.config_manager.config
+        await self._open_api()
         self.generator = UsernameGenerator(self.config)
         self.webhook_notifier = WebhookNotifier(self.config.webhook_url)
 
@@ -415,68 +1898,230 @@ class UsernameChecker:
         Display.print_section_header("GENERATE MODE")
 
         try:
+            source = input(f"{Fore.WHITE}Source {Fore.CYAN}[1] Character pool [2] Patterns / wordlist [1]: {Fore.YELLOW}").strip() or "1"
+            if source == "2":
+                await self._handle_pattern_mode()
+                return
+            if source != "1":
+                Display.print_status("Invalid source! Please select 1-2", "error")
+                return
+
             length = int(input(f"{Fore.WHITE}Username length {Fore.CYAN}[2-32]: {Fore.YELLOW}"))
             if not 2 <= length <= 32:
                 Display.print_status("Length must be between 2 and 32!", "error")
                 return
 
-            count = int(input(f"{Fore.WHITE}Number to generate: {Fore.YELLOW}"))
+            keyspace = self.generator.keyspace_size(length)
+            Display.print_status(f"Keyspace size: {keyspace:,} usernames", "info")
+
+            order = input(f"{Fore.WHITE}Order {Fore.CYAN}[1] Shuffled [2] Lexicographic [3] Random sampling [1]: {Fore.YELLOW}").strip() or "1"
+            if order not in ("1", "2", "3"):
+                Display.print_status("Invalid order! Please select 1-3", "error")
+                return
+
+            count_input = input(f"{Fore.WHITE}Number to generate {Fore.CYAN}[all]: {Fore.YELLOW}").strip()
+            count = int(count_input) if count_input else keyspace
             if count <= 0:
                 Display.print_status("Count must be positive!", "error")
                 return
 
-            usernames = self.generator.generate_batch(count, length)
-            await self._check_usernames(usernames)
+            await self._run_generate(length, count, {"1": "shuffled", "2": "lexicographic", "3": "random"}[order])
 
         except ValueError:
             Display.print_status("Please enter valid numbers!", "error")
 
+    async def _run_generate(self, length: int, count: Optional[int], order: str) -> None:
+        count = count or self.generator.keyspace_size(length)
+
+        if order == "random":
+            usernames = (self.generator.generate(length) for _ in range(count))
+            await self._check_usernames(self._iterate(usernames))
+            return
+
+        enumeration_order = self.ORDERS[order]
+
+        if not KeyspaceCoverage.supports(self.generator, length):
+            Display.print_status("Keyspace too large for coverage tracking, progress will not be saved", "warning")
+            usernames = itertools.islice(self.generator.enumerate_keyspace(length, enumeration_order), count)
+            await self._check_usernames(self._iterate(usernames))
+            return
+
+        with KeyspaceCoverage(self.generator, length) as coverage:
+            report = coverage.report()
+            if report['unchecked'] < report['keyspace']:
+                Display.print_status("Resuming from saved keyspace coverage", "info")
+                Display.print_coverage_report(report)
+
+            indices = self.generator.keyspace_indices(length, enumeration_order, seed=coverage.seed)
+            usernames = itertools.islice(coverage.pending(indices), count)
+            await self._check_usernames(self._iterate(usernames), coverage)
+
+            Display.print_coverage_report(coverage.report())
+
+    async def _handle_pattern_mode(self) -> None:
+        print(f"{Fore.LIGHTBLACK_EX}Tokens: ?l letter, ?d digit, ?s symbol, ?a character pool, {{word}} wordlist entry")
+        templates_input = input(f"{Fore.WHITE}Patterns, comma separated: {Fore.YELLOW}").strip()
+        templates = [template.strip() for template in templates_input.split(",") if template.strip()]
+        if not templates:
+            Display.print_status("At least one pattern is required!", "error")
+            return
+
+        words = []
+        if any("{word}" in template for template in templates):
+            wordlist_path = Path(input(f"{Fore.WHITE}Wordlist file {Fore.CYAN}[wordlist.txt]: {Fore.YELLOW}").strip() or "wordlist.txt")
+            if not wordlist_path.exists():
+                Display.print_status(f"File {wordlist_path} not found!", "error")
+                return
+            words = PatternGenerator.load_wordlist(wordlist_path)
+
+        leet = self.config_manager._get_boolean_input(f"{Fore.WHITE}Apply leet mutations? {Fore.RED}[y/N]: ", default=False)
+        prefixes = [affix.strip() for affix in input(f"{Fore.WHITE}Prefixes, comma separated: {Fore.YELLOW}").split(",") if affix.strip()]
+        suffixes = [affix.strip() for affix in input(f"{Fore.WHITE}Suffixes, comma separated: {Fore.YELLOW}").split(",") if affix.strip()]
+
+        patterns = PatternGenerator(self.generator, words, leet, prefixes, suffixes)
+        total = patterns.count(templates)
+        Display.print_status(f"Pattern candidates: up to {total:,} (before deduplication)", "info")
+
+        count_input = input(f"{Fore.WHITE}Number to check {Fore.CYAN}[all]: {Fore.YELLOW}").strip()
+        count = int(count_input) if count_input else total
+        if count <= 0:
+            Display.print_status("Count must be positive!", "error")
+            return
+
+        await self._run_patterns(patterns, templates, count)
+
+    async def _run_patterns(self, patterns: PatternGenerator, templates: List[str], count: Optional[int]) -> None:
+        candidates = patterns.candidates(templates, count)
+        if count:
+            candidates = itertools.islice(candidates, count)
+
+        await self._check_usernames(self._iterate(candidates))
+        Display.print_status(f"Skipped {patterns.duplicates_skipped:,} duplicate pattern candidates", "info")
+
     async def _handle_file_mode(self) -> None:
         Display.print_section_header("FILE MODE")
 
-        file_path = Path("usernames.txt")
+        paths_input = input(f"{Fore.WHITE}Input files, comma separated ('-' for stdin) {Fore.CYAN}[usernames.txt]: {Fore.YELLOW}").strip()
+        paths = [path.strip() for path in paths_input.split(",") if path.strip()] or ["usernames.txt"]
+        await self._run_files(paths)
 
-        if not file_path.exists():
-            Display.print_status(f"File {file_path} not found!", "error")
-            return
+    async def _run_files(self, paths: List[str]) -> bool:
+        for path in paths:
+            if path != "-" and not Path(path).exists():
+                Display.print_status(f"File {path} not found!", "error")
+                return False
 
-        try:
-            async with aiofiles.open(file_path, 'r') as file:
-                usernames = [line.strip() for line in await file.readlines() if line.strip()]
+        reader = UsernameFileReader(paths)
 
-            Display.print_status(f"Loaded {len(usernames)} usernames from file", "info")
-            await self._check_usernames(usernames)
+        try:
+            Display.print_status(f"Streaming usernames from {len(paths)} file(s)", "info")
+            await self._check_usernames(reader)
+            Display.print_status(f"Read {reader.lines_read} usernames from file", "info")
+            return True
 
         except Exception as error:
             Display.print_status(f"Error reading file: {error}", "error")
+            return False
 
-    async def _check_usernames(self, usernames: List[str]) -> None:
-        Display.print_section_header("CHECKING USERNAMES")
+    @staticmethod
+    async def _iterate(usernames: Iterable[str]) -> AsyncIterator[str]:
+        for username in usernames:
+            yield username
 
-        async with DiscordAPI(self.config) as api:
-            for username in usernames:
-                is_available, error = await api.check_username_availability(username)
-                self.result_manager.increment_checked()
-
-                if error:
-                    Display.print_status(f"Error checking '{username}': {error}", "error")
-                elif is_available:
-                    Display.print_username_result(username, True)
-                    await self.result_manager.save_username(username)
-                    await self.webhook_notifier.notify_available_username(username)
-                else:
-                    Display.print_username_result(username, False)
+    async def _check_usernames(self, usernames: AsyncIterator[str], coverage: Optional[KeyspaceCoverage] = None) -> None:
+        Display.print_section_header("CHECKING USERNAMES")
 
-                await asyncio.sleep(self.config.request_delay)
+        validator = UsernameValidator(self.config.dedup_capacity, self.config.dedup_error_rate)
+        exporter = MetricsExporter(self.metrics, self.config)
+        renderer = ConsoleRenderer(self.config.console_mode, self.config.console_refresh_rate, self.metrics)
+        await self.result_manager.start()
+        await self.webhook_notifier.start()
+        await exporter.start()
+        await renderer.start()
 
-            stats = self.result_manager.get_stats()
-            Display.print_results(stats)
+        try:
+            with RunProfiler(self.config), ResultCache(self.config) as cache:
+                pipeline = CheckPipeline(self.discord_api, cache, validator, self.result_manager, self.webhook_notifier,
+                                         coverage, self.config.pipeline_queue_size, self.metrics,
+                                         self.config.max_check_retries, self.config.retry_base_delay,
+                                         self.config.retry_max_delay, self.config.retry_queue_size, renderer)
+                try:
+                    await pipeline.run(usernames)
+                except AuthenticationError as error:
+                    Display.print_status(f"Authentication failed ({error}), stopping the run; check your Discord token", "error")
+        finally:
+            await renderer.close()
+            await self.webhook_notifier.close()
+            await self.result_manager.close()
+            await exporter.close()
+
+        stats = self.result_manager.get_stats()
+        stats.update(validator.get_stats())
+        stats["cache_hits"] = cache.hits
+        stats["requests_saved"] += cache.hits
+        Display.print_results(stats)
+
+        if stats["dead_lettered"]:
+            Display.print_status(f"{stats['dead_lettered']} usernames failed after retries and were written to "
+                                 f"{self.result_manager.dead_letter_file}", "warning")
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", default="config.json", help="configuration file (default: config.json)")
+    common.add_argument("--token", dest="discord_token", help="Discord token")
+    common.add_argument("--delay", dest="request_delay", type=float, help="minimum delay between requests in seconds")
+    common.add_argument("--webhook", dest="webhook_url", help="webhook URL for available usernames")
+    common.add_argument("--max-retries", dest="max_retries", type=int, help="retries for rate limited requests")
+    common.add_argument("--cache-file", dest="cache_file", help="result cache database")
+    common.add_argument("--results-file", dest="results_file", help="structured results log")
+    common.add_argument("--results-format", dest="results_format", choices=["jsonl", "csv", "none"], help="results log format")
+    common.add_argument("--metrics-file", dest="metrics_file", help="metrics JSON file (empty to disable)")
+    common.add_argument("--metrics-port", dest="metrics_port", type=int, help="serve Prometheus metrics on this port")
+    common.add_argument("--profile", dest="profile_mode", choices=["cprofile", "tracemalloc"], help="profile the run")
+    common.add_argument("--api-base-url", dest="api_base_url", help="Discord API base URL")
+    common.add_argument("--verify-token", action="store_true", help="validate the token before checking")
+    common.add_argument("--console", dest="console_mode", choices=ConsoleRenderer.MODES, help="console output mode")
+    common.add_argument("--quiet", dest="console_mode", action="store_const", const="quiet", help="no per-check console output")
+    common.add_argument("--plain", dest="console_mode", action="store_const", const="plain", help="plain log lines without colors")
+
+    pool = argparse.ArgumentParser(add_help=False)
+    pool.add_argument("--charset", help="character sets to use: any of l (letters), d (digits), s (symbols), e.g. 'ld'")
+
+    parser = argparse.ArgumentParser(description="DUCK - Discord username availability checker. Run without a command for the interactive menu.")
+    commands = parser.add_subparsers(dest="command")
+
+    check = commands.add_parser("check", parents=[common], help="check usernames from files")
+    check.add_argument("--file", dest="files", action="append", help="input file, .gz file or '-' for stdin (repeatable, default: usernames.txt)")
+
+    generate = commands.add_parser("generate", parents=[common, pool], help="generate and check usernames")
+    generate.add_argument("--length", type=int, help="username length (2-32)")
+    generate.add_argument("--count", type=int, help="number of usernames to check (default: all)")
+    generate.add_argument("--order", choices=["shuffled", "lexicographic", "random"], default="shuffled", help="keyspace order (default: shuffled)")
+    generate.add_argument("--pattern", dest="patterns", action="append", help="pattern template, e.g. '?l?l?d' or '{word}_' (repeatable)")
+    generate.add_argument("--wordlist", help="wordlist file for {word} patterns")
+    generate.add_argument("--leet", action="store_true", help="apply leet mutations to pattern candidates")
+    generate.add_argument("--prefix", dest="prefixes", action="append", default=[], help="prefix affix for pattern candidates (repeatable)")
+    generate.add_argument("--suffix", dest="suffixes", action="append", default=[], help="suffix affix for pattern candidates (repeatable)")
+
+    commands.add_parser("stats", parents=[common, pool], help="show cached results, keyspace coverage and last run metrics")
+
+    return parser
 
 async def main():
     checker = UsernameChecker()
     await checker.run()
+
+async def main_headless(args: argparse.Namespace) -> int:
+    checker = UsernameChecker(Path(args.config))
+    return await checker.run_headless(args)
+
 if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    init(autoreset=True)
+
     try:
+        if arguments.command:
+            sys.exit(asyncio.run(main_headless(arguments)))
         asyncio.run(main())
     except KeyboardInterrupt:
         print(f"\n{Fore.RED}Application interrupted by user{Style.RESET_ALL}")
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import random
+import re
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aiohttp import web
+
+@dataclass
+class MockSettings:
+    taken_ratio: float = 0.7
+    rate_limit: int = 0
+    rate_window: float = 1.0
+    forced_429_ratio: float = 0.0
+    retry_after: float = 0.5
+    slow_ratio: float = 0.0
+    slow_delay: float = 0.5
+    malformed_ratio: float = 0.0
+    server_error_ratio: float = 0.0
+    seed: Optional[int] = None
+
+class RateWindow:
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.started_at = time.monotonic()
+        self.used = 0
+
+    def consume(self) -> bool:
+        now = time.monotonic()
+        if now - self.started_at >= self.window:
+            self.started_at = now
+            self.used = 0
+
+        if self.used >= self.limit:
+            return False
+
+        self.used += 1
+        return True
+
+    @property
+    def remaining(self) -> int:
+        return max(self.limit - self.used, 0)
+
+    @property
+    def reset_after(self) -> float:
+        return max(self.window - (time.monotonic() - self.started_at), 0.0)
+
+class MockPomeloServer:
+    USERNAME_PATTERN = re.compile(r"^(?!.*\.\.)[a-z0-9_.]{2,32}$")
+    BUCKET = "mock-pomelo-bucket"
+
+    def __init__(self, settings: Optional[MockSettings] = None):
+        self.settings = settings or MockSettings()
+        self.random = random.Random(self.settings.seed)
+        self.windows: Dict[str, RateWindow] = {}
+        self.stats = {"requests": 0, "rate_limited": 0, "slow": 0, "malformed": 0, "server_error": 0}
+        self.runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/users/@me", self.handle_user)
+        app.router.add_post("/users/@me/pomelo-attempt", self.handle_pomelo)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+
+        bound_port = self.runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def is_taken(self, username: str) -> bool:
+        return zlib.crc32(username.encode()) / 0xFFFFFFFF < self.settings.taken_ratio
+
+    def _rate_limit_headers(self, window: Optional[RateWindow]) -> Dict[str, str]:
+        if window is None:
+            return {}
+
+        return {
+            "X-RateLimit-Limit": str(window.limit),
+            "X-RateLimit-Remaining": str(window.remaining),
+            "X-RateLimit-Reset-After": f"{window.reset_after:.3f}",
+            "X-RateLimit-Bucket": self.BUCKET
+        }
+
+    def _too_many_requests(self, retry_after: float, headers: Dict[str, str]) -> web.Response:
+        self.stats["rate_limited"] += 1
+        headers = dict(headers, **{"Retry-After": str(max(int(retry_after + 0.999), 1))})
+        return web.json_response(
+            {"message": "You are being rate limited.", "retry_after": round(retry_after, 3), "global": False},
+            status=429,
+            headers=headers
+        )
+
+    async def handle_user(self, request: web.Request) -> web.Response:
+        if not request.headers.get("Authorization"):
+            return web.json_response({"message": "401: Unauthorized", "code": 0}, status=401)
+
+        return web.json_response({"id": "0", "username": "mock", "discriminator": "0000"})
+
+    async def handle_pomelo(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        token = request.headers.get("Authorization")
+        if not token:
+            return web.json_response({"message": "401: Unauthorized", "code": 0}, status=401)
+
+        window = None
+        if self.settings.rate_limit > 0:
+            window = self.windows.setdefault(token, RateWindow(self.settings.rate_limit, self.settings.rate_window))
+            if not window.consume():
+                return self._too_many_requests(window.reset_after, self._rate_limit_headers(window))
+
+        headers = self._rate_limit_headers(window)
+
+        if self.random.random() < self.settings.forced_429_ratio:
+            return self._too_many_requests(self.settings.retry_after, headers)
+
+        if self.random.random() < self.settings.slow_ratio:
+            self.stats["slow"] += 1
+            await asyncio.sleep(self.settings.slow_delay)
+
+        if self.random.random() < self.settings.server_error_ratio:
+            self.stats["server_error"] += 1
+            return web.Response(text="<html>upstream error</html>", status=502, headers=headers)
+
+        if self.random.random() < self.settings.malformed_ratio:
+            self.stats["malformed"] += 1
+            return web.Response(text='{"taken": tr', content_type="application/json", headers=headers)
+
+        try:
+            username = str((await request.json()).get("username", ""))
+        except Exception:
+            return web.json_response({"message": "400: Bad Request", "code": 0}, status=400, headers=headers)
+
+        if not self.USERNAME_PATTERN.match(username):
+            return web.json_response({"message": "Invalid Form Body", "code": 50035}, status=400, headers=headers)
+
+        return web.json_response({"taken": self.is_taken(username)}, headers=headers)
+
+def parse_settings(args: argparse.Namespace) -> MockSettings:
+    return MockSettings(
+        taken_ratio=args.taken_ratio,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        forced_429_ratio=args.forced_429_ratio,
+        retry_after=args.retry_after,
+        slow_ratio=args.slow_ratio,
+        slow_delay=args.slow_delay,
+        malformed_ratio=args.malformed_ratio,
+        server_error_ratio=args.server_error_ratio,
+        seed=args.seed
+    )
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--taken-ratio", type=float, default=0.7, help="fraction of valid names reported as taken")
+    parser.add_argument("--rate-limit", type=int, default=0, help="requests allowed per token per window (0 disables)")
+    parser.add_argument("--rate-window", type=float, default=1.0, help="rate limit window in seconds")
+    parser.add_argument("--forced-429-ratio", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.5, help="retry_after for forced 429 responses")
+    parser.add_argument("--slow-ratio", type=float, default=0.0, help="fraction of requests delayed")
+    parser.add_argument("--slow-delay", type=float, default=0.5, help="delay for slow responses in seconds")
+    parser.add_argument("--malformed-ratio", type=float, default=0.0, help="fraction of requests answered 200 with truncated JSON")
+    parser.add_argument("--server-error-ratio", type=float, default=0.0, help="fraction of requests answered 502 with an HTML body")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the fault injection")
+
+async def serve(host: str, port: int, settings: MockSettings) -> None:
+    server = MockPomeloServer(settings)
+    url = await server.start(host, port)
+    print(f"Mock pomelo server listening on {url} (set api_base_url to this address)")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock of the Discord pomelo endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_settings_arguments(parser)
+    arguments = parser.parse_args()
+
+    try:
+        asyncio.run(serve(arguments.host, arguments.port, parse_settings(arguments)))
+    except KeyboardInterrupt:
+        pass